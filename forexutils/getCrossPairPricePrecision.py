@@ -7,6 +7,9 @@ class DecimalEncoder(json.JSONEncoder):
             return float(obj)
         return json.JSONEncoder.default(self, obj)
 
+# encoder is stateless, so build it once instead of on every price
+priceEncoder = DecimalEncoder()
+
 def getCrossPairPricePrecision(instrument,price):
     if "JPY" not in instrument and "HUF" not in instrument:
         prec = 5
@@ -16,5 +19,5 @@ def getCrossPairPricePrecision(instrument,price):
         return price
     else:
         prec_price = float(price)
-        prec_price = DecimalEncoder().encode(round((prec_price),prec))
+        prec_price = priceEncoder.encode(round((prec_price),prec))
         return prec_price
\ No newline at end of file
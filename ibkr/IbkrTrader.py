@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from random import randint
 from ib_insync import util, ContFuture, Stock
 from math import floor
@@ -11,6 +12,8 @@ class IbkrTrader(object):
         self.logger = logging.getLogger(logFilepath)
         self.verbose = verbose
         self.clientId = randint(0,9999)
+        # qualified stock contracts keyed by (instrument, assetClass)
+        self.qualifiedContracts = {}
         
     def connectClient(self, port=4001):
         if not self.ib.isConnected():
@@ -29,6 +32,11 @@ class IbkrTrader(object):
         return
     
     def getQualifiedContract(self, instrument, assetClass):
+        # reuse a contract that was already qualified instead of asking TWS again
+        key = (instrument, assetClass)
+        if key in self.qualifiedContracts:
+            return self.qualifiedContracts[key]
+        
         if assetClass == IB_AssetClass.ContFuture.name or assetClass == IB_AssetClass.ContFuture.value:
             contract = ContFuture(instrument)
             
@@ -38,7 +46,13 @@ class IbkrTrader(object):
         else:
             raise Exception(assetClass+' not yet supported')
             
-        self.ib.qualifyContracts(contract)
+        qualified = self.ib.qualifyContracts(contract)
+        # qualifyContracts returns [] rather than raising when it fails, so only
+        # keep contracts that actually qualified. ContFuture resolves to the
+        # current front month and would go stale after a rollover, so it's
+        # qualified fresh on every call
+        if qualified and not isinstance(contract, ContFuture):
+            self.qualifiedContracts[key] = contract
         
         return contract
         
@@ -105,15 +119,16 @@ class IbkrTrader(object):
         return util.df(bars)
     
     def checkSymbolPositions(self, symbol, accList):
+        # walk the positions of every account once and group them by account,
+        # rather than requesting and filtering each account's positions separately
+        positionsByAccount = defaultdict(list)
+        for i in self.ib.positions():
+            if i.contract.symbol == symbol:
+                positionsByAccount[i.account].append(i)
+
         symbolPositions = []
         for acc in accList:
-            accId = acc['account_identifier']
-            positions = self.ib.positions(accId)
-            # append another array because otherwise a memory location is returned, 
-            # ex: <generator object IbTrader.checkSymbolPositions.<locals>.<genexpr> at 0x7f8c98e63f50>
-            symbolPositions.append(
-                [i for i in positions if i.contract.symbol == symbol]
-            )
+            symbolPositions.append(positionsByAccount[acc['account_identifier']])
         return symbolPositions
     
     def getIbAccountNetLiquidation(self, ibAccId):
@@ -124,21 +139,29 @@ class IbkrTrader(object):
         
         return [i.value for i in accountSummary if i.tag == 'NetLiquidation'][0]
     
+    def getIbNetLiquidationByAccount(self):
+        """Return NetLiquidation for every managed account from a single account summary request"""
+        netLiquidationByAccount = {}
+        for i in self.ib.accountSummary():
+            if i.tag == 'NetLiquidation':
+                netLiquidationByAccount.setdefault(i.account, i.value)
+        return netLiquidationByAccount
+    
     def getAllAccountPositions(self, account):
-        symbolPositions = []
         accId = account['account_identifier']
-        symbolPositions.append(i for i in self.ib.positions(accId))
-        return self.ib.positions(accId) # symbolPositions[0]
+        return self.ib.positions(accId)
     
     def getTargetDollarRisk(self, accountList, targetRiskPercentage):
         accountValues = []
+        # one summary request covers every account instead of one per account
+        netLiquidationByAccount = self.getIbNetLiquidationByAccount()
         for acc in accountList:
             accId = acc['account_identifier']
             pctAllocation = float( acc['pct_allocation'] )
             #
             # TODO - maybe should not always assume only one netLiquidation value?
-            #   perhaps remove [0] and check if len > 1 first?
-            netLiquidation = self.getIbAccountNetLiquidation(accId)
+            #   currently keeps the first one reported for the account
+            netLiquidation = netLiquidationByAccount[accId]
             
             allocatedValue = pctAllocation * float( netLiquidation ) 
             #
@@ -182,6 +205,10 @@ class IbkrTrader(object):
         accountValues = self.getTargetDollarRisk(
             accountList, targetRiskPercentage)
         
+        # key the configured accounts by id once, instead of rescanning
+        # accountList for every account that falls short of one contract
+        accountsById = {a['account_identifier']: a for a in accountList}
+        
         for acc in accountValues:
             numContracts = floor( acc['dollarRisk'] / contractDollarRisk )
             
@@ -200,8 +227,7 @@ class IbkrTrader(object):
                 print(reportString)
                 
             if numContracts < 1:
-                minOverrideBool = [a for a in accountList if a['account_identifier'] \
-                           == acc['account'] ][0]['min_contract_override']
+                minOverrideBool = accountsById[acc['account']]['min_contract_override']
                 
                 if minOverrideBool:
                     numContracts = 1
@@ -218,7 +244,7 @@ class IbkrTrader(object):
             
         return accountValues
     
-    def getInstrumentData(self, instrumentInfo, formattedGranularity):
+    def getInstrumentData(self, instrumentInfo, formattedGranularity, durationStr=None):
         """
         Parameters
         ----------
@@ -226,6 +252,10 @@ class IbkrTrader(object):
             DESCRIPTION.
         formattedGranularity : TYPE
             DESCRIPTION.
+        durationStr : str, optional
+            IB history duration, e.g. '3 M'. Defaults to 6 months for
+            ContFuture and 1 year for STK; pass a shorter one when the
+            strategy only needs its longest indicator lookback.
 
         Raises
         ------
@@ -247,12 +277,12 @@ class IbkrTrader(object):
             # TODO seems like futures that expire soon cause ContFuture to fail,
             # -- on 2/22/23, MBT 2/24/23 contract data is not getting returned
             df = self.getContFutureData(
-                instrument, formattedGranularity, '6 M', 'MIDPOINT'
+                instrument, formattedGranularity, durationStr or '6 M', 'MIDPOINT'
             )
                 
         elif assetClass == 'STK':
             df = self.getStockData(
-                instrument, None, formattedGranularity, '1 Y', 'MIDPOINT'
+                instrument, None, formattedGranularity, durationStr or '1 Y', 'MIDPOINT'
             )
         else:
             raise Exception(
@@ -1,11 +1,11 @@
 from pandas import to_datetime
 
 def formatIbDataframe(df, granularity=None):
-    df['close'] = df['close'].astype(float)
-    df['high'] = df['high'].astype(float)
-    df['low'] = df['low'].astype(float)
-    df['open'] = df['open'].astype(float)
-    df['volume'] = df['volume'].astype(float)
+    # cast every price/volume column in one pass; stays float64 because
+    # TA-Lib only accepts double arrays
+    df = df.astype({
+        'close': float, 'high': float, 'low': float, 'open': float, 'volume': float
+    })
     if granularity=='1 week' or granularity=='1 day':
         df['time'] = to_datetime(df['date'], utc=True, format='%Y-%m-%d')
     else:
@@ -1,14 +1,22 @@
 import numpy as np
+from pandas import Series
 
 def KAMA(price, n=10, pow1=2, pow2=30):
     ''' kama indicator - Kaufman Adaptive Moving Average'''    
     ''' accepts pandas dataframe of prices '''
+    price = np.asarray(price, dtype=np.float64)
 
-    absDiffx = abs(price - price.shift(1) )  
+    # differences are written into preallocated buffers and abs'd in place
+    absDiffx = np.full_like(price, np.nan)
+    np.subtract(price[1:], price[:-1], out=absDiffx[1:])
+    np.abs(absDiffx, out=absDiffx)
 
-    ER_num = abs( price - price.shift(n) )
-    ER_den = absDiffx.rolling(n).sum()
-    ER = ER_num / ER_den
+    ER_num = np.full_like(price, np.nan)
+    np.subtract(price[n:], price[:-n], out=ER_num[n:])
+    np.abs(ER_num, out=ER_num)
+    ER_den = Series(absDiffx).rolling(n).sum().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ER = ER_num / ER_den
 
     sc = ( ER*(2.0/(pow1+1)-2.0/(pow2+1.0))+2/(pow2+1.0) ) ** 2.0
 
@@ -0,0 +1,15 @@
+import numpy as np
+
+def lastSma(values, timeperiod):
+    ''' latest simple moving average - the mean of the last timeperiod values '''
+    ''' avoids building the full SMA series when only the last point is used '''
+    # same lower bound talib's SMA enforces, and keeps values[-0:] from
+    # silently averaging the whole array
+    if timeperiod < 2:
+        raise Exception('lastSma timeperiod must be at least 2, got '+str(timeperiod))
+
+    # not enough history, same as talib's leading NaN
+    if len(values) < timeperiod:
+        return np.nan
+
+    return values[-timeperiod:].mean()
\ No newline at end of file
@@ -6,17 +6,21 @@ class AccountRiskModulator(object):
         self.scheme = scheme
         self.verbose = bool( verbose )
         self.isSimulation = isSimulation
+        self.schemeRules = None
         
     def getModulationSchemeRules(self):
-        """Return dataframe representation of scheme rules"""
+        """Return dataframe representation of scheme rules, built once per modulator"""
+        if self.schemeRules is not None:
+            return self.schemeRules
+        
         if self.scheme=='progressive':
             rules = {
                 "r-multiple":[-20,21,61,100],
                 "percentRisk":[.0025,.005,.01,.02],
                 "percentReturn":[-.075,.05,.25,.65]
             }
-            df = pd.DataFrame(rules)
-            return df
+            self.schemeRules = pd.DataFrame(rules)
+            return self.schemeRules
         else:
             print('ERROR AccountRiskModulator.getSchemeRules() invalid scheme')
             return None
@@ -27,14 +31,14 @@ class AccountRiskModulator(object):
     
     def getTargetRiskPercentage(self,currentNav):
         """Return target risk percentage per position, based on account return"""
-        rdf = self.getSchemeRules()
+        rdf = self.getModulationSchemeRules()
         accountReturn = self.getAccountReturn(currentNav)
         
         targetRiskPercentage=None
-        for idx in rdf.index:
-            percentReturn = float(rdf.loc[idx,'percentReturn'])
+        # walk the rule columns as arrays rather than two .loc lookups per row
+        for percentReturn, percentRisk in zip(rdf['percentReturn'].values, rdf['percentRisk'].values):
             if accountReturn >= percentReturn:
-                targetRiskPercentage = float(rdf.loc[idx,'percentRisk'])
+                targetRiskPercentage = float(percentRisk)
                 
         if self.verbose==True:
             print('\nAccountRiskModulator.getTargetRiskPercentage():')
@@ -63,30 +67,21 @@ class AccountRiskModulator(object):
         elif method=='equalCurrencyRisk':
             counter=symbol[4:]
             base=symbol[:-4]
-            baseCount=1
-            counterCount=1
-            
-            for sym in symbolList:
-                if sym==symbol:
-                    # symbol already counted
-                    continue
-                
-                if base in sym:
-                    baseCount = baseCount+1
-                    
-                if counter in sym:
-                    counterCount = counterCount+1
-                    
+            # symbol itself is counted once up front
+            otherSymbols = [sym for sym in symbolList if sym!=symbol]
+            baseCount = 1 + sum(base in sym for sym in otherSymbols)
+            counterCount = 1 + sum(counter in sym for sym in otherSymbols)
                     
             if self.verbose==True:
-                print('AccountRiskModulator.getSplitRiskByCurrency():')
-                print('\tbase: ',base)
-                print('\tcounter: ',counter)
-                print('\tsymbolList: ',symbolList)
-                print('\tbaseCount: ',baseCount)
-                print('\tcounterCount: ',counterCount)
-                print('\ttrp: ',trp)
-                print('\tfinal: ',round(trp/max(baseCount,counterCount),4))
+                reportString = 'AccountRiskModulator.getSplitRiskByCurrency():' \
+                    + '\n\tbase:  '+str(base) \
+                    + '\n\tcounter:  '+str(counter) \
+                    + '\n\tsymbolList:  '+str(symbolList) \
+                    + '\n\tbaseCount:  '+str(baseCount) \
+                    + '\n\tcounterCount:  '+str(counterCount) \
+                    + '\n\ttrp:  '+str(trp) \
+                    + '\n\tfinal:  '+str(round(trp/max(baseCount,counterCount),4))
+                print(reportString)
                 
             return round(trp/max(baseCount,counterCount),4)
         
@@ -13,13 +13,15 @@ class StocksMoneyManager(object):
                                  stop_distance)), 2)
         position_cost = units * symbol_price
         position_cost_pct = position_cost / cash
-        print('Sizing:')
-        print('\tacc_dollar_risk: \t', acc_dollar_risk)
-        print('\tstop_distance: \t\t', stop_distance)
-        print('\tsymbol_price: \t\t', symbol_price)
-        print('\ttarget units: \t\t',units)
-        print('\tposition_cost: \t\t', position_cost)
-        print('\tposition_cost_pct: \t{}%'.format(round(position_cost_pct*100, 4)) )
+        # one write for the whole sizing report instead of a print per line
+        reportString = 'Sizing:' \
+            + '\n\tacc_dollar_risk: \t '+str(acc_dollar_risk) \
+            + '\n\tstop_distance: \t\t '+str(stop_distance) \
+            + '\n\tsymbol_price: \t\t '+str(symbol_price) \
+            + '\n\ttarget units: \t\t '+str(units) \
+            + '\n\tposition_cost: \t\t '+str(position_cost) \
+            + '\n\tposition_cost_pct: \t{}%'.format(round(position_cost_pct*100, 4))
+        print(reportString)
         if position_cost > cash:
             print('Not enough cash for total position.')
             
@@ -59,10 +59,10 @@ class OandaClerk(object):
         def preprocessTransactionResponse(res):
             df = pd.json_normalize(res['transactions'])
             if 'tradesClosed' in df.columns:
-                df = df.fillna(0)
-                df = df[(df['tradesClosed']) != 0]
-                df = df[['accountBalance', 'halfSpreadCost', 'instrument', 'pl', 'time', 'tradesClosed',
-                        'units', 'batchID', 'type', 'reason']]
+                # keep only closing rows and the needed columns before filling gaps
+                df = df.loc[df['tradesClosed'].notna(),
+                            ['accountBalance', 'halfSpreadCost', 'instrument', 'pl', 'time', 'tradesClosed',
+                             'units', 'batchID', 'type', 'reason']].fillna(0)
                 df['time'] = pd.to_datetime(df['time'], utc=True)
                 df['accountBalance'] = pd.to_numeric(df['accountBalance'])
                 df['halfSpreadCost'] = pd.to_numeric(df['halfSpreadCost'])
@@ -104,8 +104,12 @@ class OandaClerk(object):
                 #df.index = df['time']
             return df
 
-        # read last saved dataframe
-        odf = pd.read_csv(history_fpath)
+        # read last saved dataframe, declaring the columns whose types are
+        # known up front so pandas doesn't infer them from the text
+        odf = pd.read_csv(history_fpath, dtype={
+            'accountBalance': 'float64', 'halfSpreadCost': 'float64',
+            'pl': 'float64', 'tradesClosed': str,
+        })
         odf = preprocessClosedTradesLoop(odf, closes_only=True)
         if len(odf) == 0:
             #print('WARNING oanda.getClosedTrades() no trades found - empty dataframe.')
@@ -126,11 +130,12 @@ class OandaClerk(object):
             res = getTransactionIDRange(to_val, lastbatch)
             mdf, tradesClosed_exists = preprocessTransactionResponse(res)
             if tradesClosed_exists:
-                odf = odf.append(mdf, ignore_index=True)
+                odf = pd.concat([odf, mdf], ignore_index=True)
                 odf.drop_duplicates(keep='first', inplace=True)
             #print('\nTo val:', to_val,
             #        '\nlastTransactionID (account): ', lastTransID,
             #        '\nLast csv batchID:', lastbatch, '\n')
+            batches = [odf]
             while to_val <= lastTransID:
                 to_val = to_val + 100
                 from_val = to_val - 99
@@ -141,9 +146,12 @@ class OandaClerk(object):
                 res = getTransactionIDRange(to_val, from_val)
                 mdf, tradesClosed_exists = preprocessTransactionResponse(res)
                 if tradesClosed_exists:
-                    odf = odf.append(mdf, ignore_index=True)
+                    batches.append(mdf)
                     #odf.drop_duplicates(keep='first', inplace=True)
-                    odf = preprocessClosedTradesLoop(odf)
+            # join every batch in one concat rather than copying the frame per batch
+            odf = pd.concat(batches, ignore_index=True)
+            # each batch is already typed, so the full frame only needs one pass
+            odf = preprocessClosedTradesLoop(odf)
             # odf = testDropDuplicates(odf)
             odf.to_csv(history_fpath, index=False)
         elif to_val > lastTransID:
@@ -153,7 +161,7 @@ class OandaClerk(object):
                 #print('tradesClosed_exists between to_val, lastbatch: ',to_val,lastbatch)
                 #print('odf: ',odf)
                 #print('odf.iloc[-1]',odf.iloc[[-1]])
-                odf = odf.append(mdf, ignore_index=True)
+                odf = pd.concat([odf, mdf], ignore_index=True)
                 # print('len(odf) before drop: ',len(odf))
                 odf['time'] = pd.to_datetime(odf['time'], utc=True)
                 odf['accountBalance']=pd.to_numeric(odf['accountBalance'])
@@ -226,23 +234,29 @@ class OandaClerk(object):
         def transformColumnID(opendf, trade_state):
             """Transforms column ID (tradeOpened or tradesClosed) to have int values and removes the dicts."""
 
+            def parseTradeID(value):
+                # each cell is parsed once; closed trades may hold a list of closures
+                if type(value) == int:
+                    return value
+                parsed = ast.literal_eval(value)
+                if type(parsed) == list and trade_state == 'closed':
+                    return int(parsed[0]['tradeID'])
+                elif type(parsed) == dict: # unsure if dict exists for tradesClosed
+                    return int(parsed['tradeID'])
+                return value
+
             if trade_state == 'opened':
                 print('Transforming tradeOpened column.')
-                for row in range(0,len(opendf)):
-                    if type(opendf.loc[row,'tradeOpened']) == int:
-                        continue
-                    elif type(ast.literal_eval(opendf.loc[row,'tradeOpened'])) == dict:
-                        opendf.loc[row,'tradeOpened'] = int(ast.literal_eval(opendf.loc[row,'tradeOpened'])['tradeID'])
-
+                columnID = 'tradeOpened'
             elif trade_state == 'closed':
                 print('Transforming tradesClosed column.')
-                for row in range(0,len(opendf)):
-                    if type(opendf.loc[row,'tradesClosed']) == int:
-                        continue
-                    elif type(ast.literal_eval(opendf.loc[row,'tradesClosed'])) == list:
-                        opendf.loc[row,'tradesClosed'] = int(ast.literal_eval(opendf.loc[row,'tradesClosed'])[0]['tradeID'])
-                    elif type(ast.literal_eval(opendf.loc[row,'tradesClosed'])) == dict: # unsure if dict exists here
-                        opendf.loc[row,'tradesClosed'] = int(ast.literal_eval(opendf.loc[row,'tradesClosed'])['tradeID'])
+                columnID = 'tradesClosed'
+            else:
+                return opendf
+
+            if len(opendf) != 0:
+                # assign the whole column once instead of writing cell by cell
+                opendf[columnID] = [parseTradeID(value) for value in opendf[columnID].values]
 
             return opendf
 
@@ -253,6 +267,7 @@ class OandaClerk(object):
             from_val = begTradeID
             to_val = begTradeID + 100
 
+            frames = []
             while to_val < endTradeID:
                 print('\tfrom_val: ', from_val, '-  to_val: ', to_val)
                 transResponse = self.getTransactionIDRange(to_val, from_val)
@@ -260,10 +275,13 @@ class OandaClerk(object):
                 tid_df = pd.json_normalize(transResponse['transactions'])
                 df = preprocessTransactionsDataframe(tid_df, trade_state=trade_state)
                 if len(df) != 0:
-                    odf = odf.append(df, ignore_index=True)
-                    odf.drop_duplicates(keep='first', inplace=True)
+                    frames.append(df)
                 to_val = to_val + 100
                 from_val = to_val - 99
+            # one concat and one dedupe over all ranges, keeping first occurrences as before
+            if frames:
+                odf = pd.concat(frames, ignore_index=True)
+                odf.drop_duplicates(keep='first', inplace=True, ignore_index=True)
             odf = transformColumnID(odf, trade_state)
             csv_name = trade_state + '-history.csv'
             odf.to_csv(csv_name, index=False)
@@ -305,7 +323,7 @@ class OandaClerk(object):
                 tid_df = pd.json_normalize(transResponse['transactions'])
                 df = preprocessTransactionsDataframe(tid_df,trade_state=trade_state)
                 if len(df) != 0:
-                    odf = odf.append(df, ignore_index=True)
+                    odf = pd.concat([odf, df], ignore_index=True)
                     odf = transformColumnID(odf,trade_state)
                     odf.drop_duplicates(keep='first',inplace=True)
                 odf.to_csv(csv_name,index=False)
@@ -314,14 +332,21 @@ class OandaClerk(object):
 
         def prepTradesClosed(adf): # not currently used
             """Input raw dataframe collected from multiple oanda requests and return a dataframe with matching tradeClose columns."""
-            for idx in adf.index:
-                tradesClosedRow = adf['tradesClosed'][idx]
+            closeRows = []
+            closeIDs = []
+            closeUnits = []
+            for idx, tradesClosedRow in zip(adf.index, adf['tradesClosed'].values):
                 d = tradesClosedRow.replace("'", '"') # json transform wants double quotes
                 jd = json.loads(d) # creates a list
 
                 if type(jd) == list:
-                    adf.loc[idx,'tradeClose.tradeID'] = jd[0]['tradeID']
-                    adf.loc[idx,'tradeClose.units'] = jd[0]['units']
+                    closeRows.append(idx)
+                    closeIDs.append(jd[0]['tradeID'])
+                    closeUnits.append(jd[0]['units'])
+            # write the parsed rows back in one assignment per column
+            if closeRows:
+                adf.loc[closeRows,'tradeClose.tradeID'] = closeIDs
+                adf.loc[closeRows,'tradeClose.units'] = closeUnits
             return adf
 
         def getTimeInTrade(closed, opened):
@@ -331,16 +356,16 @@ class OandaClerk(object):
             if 'timeintrade' not in closed.columns:
                 print('getTimeInTrade: init timeintrade column.')
                 closed['timeintrade'] = 0
-            for row in closed[closed['tradesClosed'] != 0].index:
-                tradeID = closed.loc[row,'tradesClosed']
-                close_time = closed.loc[row,'time']
-                open_data = opened[opened['tradeOpened'] == tradeID]
-                if len(open_data) != 0:
-                    open_time = open_data['time'].values[0]
-                    timeintrade = close_time - open_time
-                    closed.loc[row,'timeintrade'] = timeintrade
-                else:
-                    print('getTimeInTrade: no matching tradeID in opened data for tradeID', tradeID)
+            # match every closing row to its first open time in one pass instead
+            # of filtering the opened frame once per closed trade
+            openTimes = opened.drop_duplicates('tradeOpened').set_index('tradeOpened')['time']
+            isClose = closed['tradesClosed'] != 0
+            closeOpenTimes = closed['tradesClosed'].where(isClose).map(openTimes)
+            hasOpen = isClose & closeOpenTimes.notna()
+            for tradeID in closed.loc[isClose & ~hasOpen, 'tradesClosed']:
+                print('getTimeInTrade: no matching tradeID in opened data for tradeID', tradeID)
+            closed['timeintrade'] = closed['timeintrade'].astype(object)
+            closed.loc[hasOpen,'timeintrade'] = closed.loc[hasOpen,'time'] - closeOpenTimes[hasOpen]
             return closed
 
         opened = updateHistoryCsv(trade_state='opened')
@@ -368,8 +393,8 @@ class OandaClerk(object):
             df = df[df['complete'] == True]
         if format_type == 'BuildAlpha':
             todatetime = pd.to_datetime(df['time'], utc=True)
-            df['Date'] = todatetime.map(lambda x: x.strftime('%m/%d/%Y'))
-            df['Time'] = todatetime.map(lambda x: x.strftime('%H:%M:%S'))
+            df['Date'] = todatetime.dt.strftime('%m/%d/%Y')
+            df['Time'] = todatetime.dt.strftime('%H:%M:%S')
             df['Open'] = df['mid.o'].astype(float)
             df['High'] = df['mid.h'].astype(float)
             df['Low'] = df['mid.l'].astype(float)
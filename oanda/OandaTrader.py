@@ -19,6 +19,8 @@ class OandaTrader(object):
         self.client = oandapyV20.API(access_token=self.access_token, environment=self.environment)
         self.acc_denom = acc_denom
         self.max_risk_pct = max_risk_pct
+        self.instruments = None
+        self.instrumentNames = None
 
     def getOandaData(self, bar_count, granularity, instrument):
         """Pulls specified data from Oanda api"""
@@ -66,13 +68,25 @@ class OandaTrader(object):
         response = self.client.request(r)
         return response
 
+    def getInstruments(self):
+        '''Read instruments.csv on first use and reuse the parsed frame afterwards.'''
+        if self.instruments is None:
+            self.instruments = pd.read_csv('instruments.csv')
+        return self.instruments
+
+    def getInstrumentNames(self):
+        '''Return the instrument names from instruments.csv as a set for constant-time lookups.'''
+        if self.instrumentNames is None:
+            self.instrumentNames = frozenset(self.getInstruments()['name'].values)
+        return self.instrumentNames
+
     def findExchangePairPrice(self, target_pair, direction):
         '''Used for calculating position size. Finds the pair that exists between
         the acc_denom currency and the target_pair counter currency.'''
-        idf = pd.read_csv('instruments.csv')
+        instrumentNames = self.getInstrumentNames()
         acc_denom = self.acc_denom
         if self.acc_denom in target_pair:
-            if (self.acc_denom + target_pair[-4:]) in idf['name'].values:
+            if (self.acc_denom + target_pair[-4:]) in instrumentNames:
                 # print('acc_denom is base in exchange currency')
                 exchange_instrument = self.acc_denom + target_pair[-4:]
                 if direction == 'LONG':
@@ -82,7 +96,7 @@ class OandaTrader(object):
                 else:
                     print('ERROR findExchangePairPrice: direction must be LONG or SHORT')
                 return exchange_rate
-            elif (target_pair[:4] + self.acc_denom) in idf['name'].values:
+            elif (target_pair[:4] + self.acc_denom) in instrumentNames:
                 # print('acc_denom is counter in exchange currency')
                 exchange_instrument = target_pair[:4] + self.acc_denom
                 if direction == 'LONG':
@@ -93,7 +107,7 @@ class OandaTrader(object):
                     print('ERROR findExchangePairPrice: direction must be LONG or SHORT')
                 return exchange_rate
         elif acc_denom not in target_pair:
-            if acc_denom + target_pair[-4:] in idf.values:
+            if acc_denom + target_pair[-4:] in instrumentNames:
                 exchange_instrument = acc_denom + target_pair[-4:]
                 if direction == 'LONG':
                     exchange_rate = self.getOandaAskPrice(exchange_instrument)
@@ -102,7 +116,7 @@ class OandaTrader(object):
                 else:
                     print('ERROR findExchangePairPrice: direction must be LONG or SHORT')
                 return exchange_rate
-            elif target_pair[-3:] + '_' + acc_denom in idf.values:
+            elif target_pair[-3:] + '_' + acc_denom in instrumentNames:
                 exchange_instrument = target_pair[-3:] + '_' + acc_denom
                 if direction == 'LONG':
                     exchange_rate = self.getOandaAskPrice(exchange_instrument)
@@ -115,42 +129,32 @@ class OandaTrader(object):
         else:
             return 'Something went wrong in findExchangePairPrice finding the acc_denom / target_pair price.'
 
-    def getOandaMidpointPrice(self, instrument):
-        '''return the midpoint of current instrument ask and bid prices'''
-        #accountID, access_token = exampleAuth()
-        #client = oandapyV20.API(access_token=access_token)
+    def getOandaBidAskPrices(self, instrument):
+        '''Return the instantaneous (bid, ask) prices of instrument from a single
+        pricing request. The other price getters all derive from this one.'''
         params = {
             "instruments": instrument
             }
         r = pricing.PricingInfo(self.accountID, params=params)
         response = self.client.request(r)
-        data = pd.json_normalize(response['prices'])
-        asks = float(data['asks'][0][0]['price'])
-        bids = float(data['bids'][0][0]['price'])
+        price = response['prices'][0]
+        bid_price = float(price['bids'][0]['price'])
+        ask_price = float(price['asks'][0]['price'])
+        return bid_price, ask_price
+
+    def getOandaMidpointPrice(self, instrument):
+        '''return the midpoint of current instrument ask and bid prices'''
+        bids, asks = self.getOandaBidAskPrices(instrument)
         midpoint = (asks + bids) / 2
         return midpoint
 
     def getOandaBidPrice(self, instrument):
-        """Return instantaneous ask price of instrument"""
-        params = {
-            "instruments": instrument
-            }
-        r = pricing.PricingInfo(self.accountID, params=params)
-        response = self.client.request(r)
-        data = pd.json_normalize(response['prices'])
-        bid_price = float(data['bids'][0][0]['price'])
-        return bid_price
+        """Return instantaneous bid price of instrument"""
+        return self.getOandaBidAskPrices(instrument)[0]
 
     def getOandaAskPrice(self, instrument):
-        """Return instantaneous bid price of instrument"""
-        params = {
-            "instruments": instrument
-            }
-        r = pricing.PricingInfo(self.accountID, params=params)
-        response = self.client.request(r)
-        data = pd.json_normalize(response['prices'])
-        ask_price = float(data['asks'][0][0]['price'])
-        return ask_price
+        """Return instantaneous ask price of instrument"""
+        return self.getOandaBidAskPrices(instrument)[1]
 
     def getMaxPositionDollarRisk(self):
         acc_val = self.getOandaAccNAV()
@@ -412,11 +416,7 @@ class OandaTrader(object):
 
     def checkOandaSpread(self, instrument, pip_threshold):
         '''If the difference between asks and bids for the input instrument, divided by the instrument multiplier factor, is less than the pip_threshold, return True.'''
-        params = {"instruments": instrument}
-        r = pricing.PricingInfo(self.accountID, params=params)
-        res = self.client.request(r)
-        asks = float(res['prices'][0]['asks'][0]['price'])
-        bids = float(res['prices'][0]['bids'][0]['price'])
+        bids, asks = self.getOandaBidAskPrices(instrument)
         val_spread = asks - bids
         mult = fx.getCrossPairMultiplier(instrument)
         pip_spread = val_spread / mult
@@ -442,9 +442,11 @@ class OandaTrader(object):
 
     def closeAllOpenPositions(self):
         pos = self.getOandaTradesState()
-        for row in range(0,len(pos)):
-            inst = pos.loc[row,'instrument']
-            units = int(pos.loc[row,'currentUnits'])
+        if len(pos) == 0:
+            return print('oandaTrader.closeAllOpenPositions() double check all positions closed.')
+        # walk the two columns directly rather than indexing the frame per row
+        for inst, currentUnits in zip(pos['instrument'].values, pos['currentUnits'].values):
+            units = int(currentUnits)
             if units > 0:
                 try:
                     self.sendOandaCloseLong(inst)
@@ -461,37 +463,19 @@ class OandaTrader(object):
         """Dataframe input must have instrument and trade_phase columns."""
         open_trades = self.getOandaTradesState()
         if open_trades.size != 0:
-            for row in range(0,len(sdf)):
-                if sdf.loc[row,'instrument'] in open_trades['instrument'].values:
-                    # print(sdf.loc[row,'instrument'], 'trade still on.')
-                    continue
-                else:
-                    # print(sdf.loc[row,'instrument'], 'no trade on.')
-                    sdf.loc[row,'trade_phase'] = 0
+            # index the open instruments once instead of rescanning them per row
+            stopped = ~sdf['instrument'].isin(open_trades['instrument'])
+            sdf.loc[stopped,'trade_phase'] = 0
         else:
             sdf['trade_phase'] = 0
             print('Empty open_trades response.')
         return sdf
 
     def getOandaAsksPrice(self, instrument):
-        params = {
-            "instruments": instrument
-            }
-        r = pricing.PricingInfo(self.accountID, params=params)
-        response = self.client.request(r)
-        data = pd.json_normalize(response['prices'])
-        asks = float(data['asks'][0][0]['price'])
-        return asks
+        return self.getOandaAskPrice(instrument)
 
     def getOandaBidsPrice(self, instrument):
-        params = {
-            "instruments": instrument
-            }
-        r = pricing.PricingInfo(self.accountID, params=params)
-        response = self.client.request(r)
-        data = pd.json_normalize(response['prices'])
-        bids = float(data['bids'][0][0]['price'])
-        return bids
+        return self.getOandaBidPrice(instrument)
 
     def getOandaInstrumentOpenTrades(self,instrument):
         params ={
@@ -519,14 +503,11 @@ class OandaTrader(object):
         tdf = self.getOandaInstrumentOpenTrades(instrument)
         if 'stopLossOrder.tradeID' in tdf.columns:
             new_stop = fx.getCrossPairPricePrecision(instrument,new_stop_price)
-            for i in range(0,len(tdf)):
+            stopOrders = zip(tdf['stopLossOrder.tradeID'].values, tdf['stopLossOrder.id'].values)
+            for tradeID, orderID in stopOrders:
                 try:
-                    if int(tdf.loc[i,'stopLossOrder.tradeID']) > 0:
-                        tradeID = tdf.loc[i,'stopLossOrder.tradeID']
-                        orderID = tdf.loc[i,'stopLossOrder.id']
+                    if int(tradeID) > 0:
                         self.replaceStopOrder(new_stop,tradeID,orderID)
-                    else:
-                        i=+1
                 except ValueError:
                     print('Skipping trailing stop, replacing stop loss orders only.')
         return
\ No newline at end of file
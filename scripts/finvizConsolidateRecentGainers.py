@@ -25,8 +25,7 @@ def get_top_stocks(sort, filters):
     # tickers_csv = ','.join(tickers)
     # return tickers_csv
 
-    tickers = [f'{ticker}' for ticker in df['Ticker'].values]
-    return tickers
+    return df['Ticker'].tolist()
 
 def main():
     filters = {
@@ -38,12 +37,14 @@ def main():
     }
 
     # Fetch stocks sorted by different performance metrics
-    top_perf_month = get_top_stocks('Performance (Month)', filters)
-    top_perf_quarter = get_top_stocks('Performance (Quarter)', filters)
-    top_perf_half = get_top_stocks('Performance (Half Year)', filters)
-
-    # Combine and deduplicate tickers
-    unique_tickers = set(top_perf_month + top_perf_quarter + top_perf_half)
+    # Run one after another: finvizfinance paces its page requests with sleep_sec,
+    # and firing the screeners at once would defeat that and get throttled
+    sorts = ('Performance (Month)', 'Performance (Quarter)', 'Performance (Half Year)')
+
+    # Combine and deduplicate tickers as each screener finishes
+    unique_tickers = set()
+    for sort in sorts:
+        unique_tickers.update(get_top_stocks(sort, filters))
 
     # Print results
     print("\n================ Results ================")
@@ -1,12 +1,20 @@
 from enums import TradeDirection, TrendDirection, EntryMethod, FilterType
-from indicators import KAMA
-from talib import EMA, SMA, MAX, MIN, ROC, ATR, RSI
+from indicators.KAMA import KAMA
+from indicators.lastSma import lastSma
+from talib import EMA, ROC, ATR, RSI
+import numpy as np
 import logging
 
 class EntryEngine(object):
     def __init__(self, strategyName, df, entryVars, verbose=False,
                  trendBias=None, tradableSpread=None, simulation=False):
         self.df = df
+        # bar columns as contiguous float64 arrays, read once and shared by every signal method;
+        # talib needs exactly this layout, so it won't copy them on each call.
+        # high/low are only read by getHighsLows, so close-only frames still work
+        self.closes = np.ascontiguousarray(df.close.values, dtype=np.float64)
+        self.highs = None
+        self.lows = None
         self.logger = logging.getLogger(strategyName)
         self.entryMethod = entryVars['method']
         self.filterType = entryVars['filter_type']
@@ -19,6 +27,33 @@ class EntryEngine(object):
         self.trendDirection = None
         self.signal = None
 
+        # latest moving average values keyed by (type, timeperiod), so the trend
+        # filter and the entry method share any average they both need
+        self.maCache = {}
+
+    def getHighsLows(self):
+        """
+        Return the high and low arrays, reading them from the frame on first use
+        """
+        if self.highs is None:
+            self.highs = np.ascontiguousarray(self.df.high.values, dtype=np.float64)
+            self.lows = np.ascontiguousarray(self.df.low.values, dtype=np.float64)
+
+        return self.highs, self.lows
+
+    def getMa(self, maType, timeperiod):
+        '''
+        Return the latest EMA or SMA for timeperiod, computing it at most once per engine
+        '''
+        key = (maType, timeperiod)
+        if key not in self.maCache:
+            if maType == FilterType.EMA.name:
+                self.maCache[key] = EMA(self.closes, timeperiod=timeperiod)[-1]
+            else:
+                self.maCache[key] = lastSma(self.closes, timeperiod)
+
+        return self.maCache[key]
+
     def run(self):
 
         try:
@@ -30,30 +65,18 @@ class EntryEngine(object):
                 + '\ncurrent trendDirection set: '+str(self.trendDirection)
             )
 
-        if self.entryMethod == EntryMethod.HOURLY_CORNFLOWER.name:
-            self.hourlyCornflower()
-        elif self.entryMethod == EntryMethod.WEEKLY_TREND_TRADER.name:
-            self.weeklyTrendTrader()
-        elif self.entryMethod == EntryMethod.DONCHIAN_CHANNEL_BREAKOUT.name:
-            self.donchianChannelBreakout()
-        elif self.entryMethod == EntryMethod.KELTNER_CHANNEL_BREAKOUT.name:
-            self.keltnerChannelBreakout()
-        elif self.entryMethod == EntryMethod.RSI_PULLBACK.name:
-            self.rsiPullback()
-        elif self.entryMethod == EntryMethod.SMA_PRICE_CROSS.name:
-            self.smaPriceCross()
-        else:
+        entryMethod = self.entryMethods.get(self.entryMethod)
+        if entryMethod is None:
             raise Exception(str(self.entryMethod)+' entryMethod not supported')
+        entryMethod(self)
 
         return
         
 
     def getTrendDirection(self):
         if self.filterType == FilterType.EMA.name:
-            close = self.df.close[-1]
-            ema = EMA(
-                self.df.close, timeperiod=int(self.filterParameter)
-            )[-1]
+            close = self.closes[-1]
+            ema = self.getMa(FilterType.EMA.name, int(self.filterParameter))
 
             if close > ema:
                 self.trendDirection = TrendDirection.UP.name
@@ -61,10 +84,8 @@ class EntryEngine(object):
                 self.trendDirection = TrendDirection.DOWN.name
                 
         if self.filterType == FilterType.SMA.name:
-            close = self.df.close[-1]
-            sma = SMA(
-                self.df.close, timeperiod=int(self.filterParameter)
-            )[-1]
+            close = self.closes[-1]
+            sma = self.getMa(FilterType.SMA.name, int(self.filterParameter))
             
             if close > sma:
                 self.trendDirection = TrendDirection.UP.name
@@ -80,17 +101,24 @@ class EntryEngine(object):
 
     def hourlyCornflower(self):
         if not self.simulation:
-            H1Close = self.df.close[-1]
-            H1EMA8 = EMA(self.df.close, timeperiod=8)[-1]
-            H1EMA12 = EMA(self.df.close, timeperiod=12)[-1]
-            H1EMA24 = EMA(self.df.close, timeperiod=24)[-1]
-            H1EMA72 = EMA(self.df.close, timeperiod=72)[-1]
-            LONGBO = (H1Close == self.df.close[-8:].max())
-            SHORTBO = (H1Close == self.df.close[-8:].min())
+            recentCloses = self.closes[-8:]
+            H1Close = recentCloses[-1]
+            LONGBO = (H1Close == recentCloses.max())
+            SHORTBO = (H1Close == recentCloses.min())
         else:
             raise Exception(self.entryMethod, ' simulation not yet supported')
             return
 
+        # both signals need an 8 bar breakout and a tradable spread,
+        # so skip the EMA stack when neither can fire
+        if self.tradableSpread == False or not (LONGBO or SHORTBO):
+            return
+
+        H1EMA8 = self.getMa(FilterType.EMA.name, 8)
+        H1EMA12 = self.getMa(FilterType.EMA.name, 12)
+        H1EMA24 = self.getMa(FilterType.EMA.name, 24)
+        H1EMA72 = self.getMa(FilterType.EMA.name, 72)
+
         if self.trendBias != TradeDirection.SHORT.name and self.tradableSpread != False \
                 and H1EMA8 > H1EMA12 and H1EMA12 > H1EMA24 and H1EMA24 > H1EMA72 \
                 and H1Close > H1EMA24 and LONGBO == True:
@@ -113,10 +141,10 @@ class EntryEngine(object):
 
     def hourlyKamaCross(self, slowKama, fastKama):
         if not self.simulation:
-            close = self.df.close[-1]
-            # TODO does this return a series or a data point?
-            slowMa = KAMA(self.df.close, 10, slowKama, 30)
-            fastMa = KAMA(self.df.close, 10, fastKama, 30)
+            close = self.closes[-1]
+            # KAMA returns the full array, only the latest values decide the signal
+            slowMa = KAMA(self.closes, 10, slowKama, 30)[-1]
+            fastMa = KAMA(self.closes, 10, fastKama, 30)[-1]
         else:
             raise Exception(self.entryMethod, ' simulation not yet supported')
 
@@ -146,14 +174,26 @@ class EntryEngine(object):
             raise Exception(self.entryMethod+' must have channelLength kwarg')
 
         channelLength = self.kwargs[0]['channelLength']
+        # same lower bound talib's MAX/MIN enforce, and keeps closes[-0:] from
+        # silently covering the whole series
+        if channelLength < 2:
+            raise Exception(self.entryMethod+' channelLength must be at least 2, got '+str(channelLength))
+
         if not self.simulation:
             #high = self.df.high[-1]
             #highestHigh = MAX(self.df.high, timeperiod=channelLength)[-1]
             #low = self.df.low[-1]
             #lowestLow = MIN(self.df.low, timeperiod=channelLength)[-1]
-            close = self.df.close[-1]
-            highestClose = MAX(self.df.close, timeperiod=channelLength)[-1]
-            lowestClose = MIN(self.df.close, timeperiod=channelLength)[-1]
+            # channel extremes only need the last channelLength closes
+            recentCloses = self.closes[-channelLength:]
+            close = recentCloses[-1]
+            if len(recentCloses) < channelLength:
+                # not enough history yet, same as talib MAX/MIN's leading NaN,
+                # so neither breakout comparison can pass
+                highestClose = lowestClose = float('nan')
+            else:
+                highestClose = recentCloses.max()
+                lowestClose = recentCloses.min()
             # TODO: middle band is average of upper & lower bands, if needed
         else:
             raise Exception(self.entryMethod+' simulation not yet supported')
@@ -185,7 +225,7 @@ class EntryEngine(object):
 
                 self.signal = TradeDirection.SHORT.name
 
-        time = self.df.time[-1]
+        time = self.df.time.iloc[-1]
         reportString = '\n'+self.entryMethod+' channelLength: '+str(channelLength) \
             + '\n\ttime:         '+str(time) \
             + '\n\tclose:        '+str(close) \
@@ -216,13 +256,13 @@ class EntryEngine(object):
         atrParameter = self.kwargs[0]['atrParameter']
         atrMultiplier = self.kwargs[0]['atrMultiplier']
         if not self.simulation:
-            close = self.df.close.values[-1]
-            atrSeries = ATR(self.df.high, self.df.low, self.df.close, timeperiod=atrParameter) * atrMultiplier
-            middleBand = EMA(self.df.close, timeperiod=channelLength)
-            upperBand = middleBand + atrSeries
-            upperBandValue = upperBand.values[-1]
-            lowerBand = middleBand - atrSeries
-            lowerBandValue = lowerBand.values[-1]
+            close = self.closes[-1]
+            # only the latest band values are used, so build them from scalars
+            highs, lows = self.getHighsLows()
+            atrValue = ATR(highs, lows, self.closes, timeperiod=atrParameter)[-1] * atrMultiplier
+            middleBandValue = self.getMa(FilterType.EMA.name, channelLength)
+            upperBandValue = middleBandValue + atrValue
+            lowerBandValue = middleBandValue - atrValue
         else:
             raise Exception(self.entryMethod+' simulation not yet supported')
 
@@ -253,7 +293,7 @@ class EntryEngine(object):
 
                 self.signal = TradeDirection.SHORT.name
 
-        time = self.df.time[-1]
+        time = self.df.time.iloc[-1]
         reportString = '\n'+self.entryMethod+' channelLength: '+str(channelLength) \
             + '\n\ttime:         '+str(time) \
             + '\n\tclose:        '+str(close) \
@@ -278,7 +318,7 @@ class EntryEngine(object):
         rsiThreshold = self.kwargs[0]['rsiThreshold']
         
         if not self.simulation:
-            rsi = RSI(self.df.close, timeperiod=rsiLength).values[-1]
+            rsi = RSI(self.closes, timeperiod=rsiLength)[-1]
             
         else:
             raise Exception(self.entryMethod+' simulation not yet supported')
@@ -310,7 +350,7 @@ class EntryEngine(object):
 
                 self.signal = TradeDirection.SHORT.name
 
-        time = self.df.time[-1]
+        time = self.df.time.iloc[-1]
         reportString = '\n'+self.entryMethod \
             + '\n\ttime:         '+str(time) \
             + '\n\trsiLength: '+str(rsiLength) \
@@ -332,10 +372,10 @@ class EntryEngine(object):
             raise Exception(self.entryMethod+' must have channelLength kwarg')
             
         parameter = self.kwargs[0]['parameter']
-        close = self.df.close.values[-1]
+        close = self.closes[-1]
         
         if not self.simulation:
-            sma = SMA(self.df.close, timeperiod=parameter).values[-1]
+            sma = self.getMa(FilterType.SMA.name, parameter)
             
         else:
             raise Exception(self.entryMethod+' simulation not yet supported')
@@ -367,7 +407,7 @@ class EntryEngine(object):
 
                 self.signal = TradeDirection.SHORT.name
 
-        time = self.df.time[-1]
+        time = self.df.time.iloc[-1]
         reportString = '\n'+self.entryMethod \
             + '\n\ttime:         '+str(time) \
             + '\n\tclose: '+str(close) \
@@ -396,13 +436,26 @@ class EntryEngine(object):
         rocThreshold = self.kwargs[0]['rocThreshold']
         highestCloseBreakout = self.kwargs[0]['highestCloseBreakout']
 
-        self.df['ROC'] = ROC(self.df.close, timeperiod=rocTimeperiod)
-        self.df['HC'] = self.df['close'].rolling(highestCloseBreakout).max()
-        close = self.df.close.values[-1]
-        roc = self.df['ROC'].values[-1]
-        breakout = (close == self.df.close[-highestCloseBreakout:].max())
+        # read from the close array instead of adding ROC/HC columns to self.df
+        closes = self.closes
+        close = closes[-1]
+        breakout = (close == closes[-highestCloseBreakout:].max())
+        if breakout == False:
+            return
+
+        roc = ROC(closes, timeperiod=rocTimeperiod)[-1]
 
-        if (roc > rocThreshold) and (breakout == True):
+        if roc > rocThreshold:
             self.signal = TradeDirection.LONG.name
 
         return
+
+    # entry method names mapped to their signal functions, built once at import
+    entryMethods = {
+        EntryMethod.HOURLY_CORNFLOWER.name: hourlyCornflower,
+        EntryMethod.WEEKLY_TREND_TRADER.name: weeklyTrendTrader,
+        EntryMethod.DONCHIAN_CHANNEL_BREAKOUT.name: donchianChannelBreakout,
+        EntryMethod.KELTNER_CHANNEL_BREAKOUT.name: keltnerChannelBreakout,
+        EntryMethod.RSI_PULLBACK.name: rsiPullback,
+        EntryMethod.SMA_PRICE_CROSS.name: smaPriceCross,
+    }
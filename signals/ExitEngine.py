@@ -1,6 +1,8 @@
 
 from enums import TradeDirection, MarketSentiment, ExitMethod
-from talib import ATR, EMA, RSI, SMA
+from indicators.lastSma import lastSma
+from talib import ATR, EMA, RSI
+import numpy as np
 import logging
 
 
@@ -8,6 +10,12 @@ class ExitEngine(object):
     def __init__(self, strategyName, df, exitVars, tradeDirection=None, verbose=False, simulation=False):
         self.logger = logging.getLogger(strategyName)
         self.df = df
+        # bar columns as contiguous float64 arrays, read once and shared by every exit check;
+        # talib needs exactly this layout, so it won't copy them on each call.
+        # high/low are only read by getHighsLows, so close-only frames still work
+        self.closes = np.ascontiguousarray(df.close.values, dtype=np.float64)
+        self.highs = None
+        self.lows = None
         self.exitVars = exitVars
         self.tradeDirection = tradeDirection
         self.verbose = verbose
@@ -53,30 +61,56 @@ class ExitEngine(object):
 
         self.brokerStopDistance = None
 
+        # latest ATR value keyed by timeperiod, shared by every exit check
+        self.atrCache = {}
+
+    def getHighsLows(self):
+        """
+        Return the high and low arrays, reading them from the frame on first use
+        """
+        if self.highs is None:
+            self.highs = np.ascontiguousarray(self.df.high.values, dtype=np.float64)
+            self.lows = np.ascontiguousarray(self.df.low.values, dtype=np.float64)
+
+        return self.highs, self.lows
+
+    def getAtr(self, timeperiod):
+        """
+        Return the latest ATR for timeperiod, computing it at most once per engine
+        """
+        if timeperiod not in self.atrCache:
+            highs, lows = self.getHighsLows()
+            self.atrCache[timeperiod] = ATR(
+                highs, lows, self.closes, timeperiod=timeperiod
+            )[-1]
+
+        return self.atrCache[timeperiod]
+
     def getSystemExits(self):
         """
         Check for exits that this system will manage & execute
         """
         if self.useTechnicalCondition:
+            close = self.closes[-1]
             for condition in self.tcExits:
                 print('\nchecking technical exit condition: ', condition)
+                conditionType = condition['type']
 
                 if condition['systemOrBroker'] == 'system':
-                    if condition['type'] == ExitMethod.EMA_PRICE_CROSS.name or\
-                        condition['type'] == ExitMethod.SMA_PRICE_CROSS.name:
-                        print('checking MA Price Cross exit, ', condition['type'])
+                    if conditionType == ExitMethod.EMA_PRICE_CROSS.name or\
+                        conditionType == ExitMethod.SMA_PRICE_CROSS.name:
+                        print('checking MA Price Cross exit, ', conditionType)
                         parameter = int(condition['parameter'])
                         
-                        if condition['type'] == ExitMethod.EMA_PRICE_CROSS.name:
-                            ma = EMA(self.df.close, timeperiod=parameter)[-1]
+                        if conditionType == ExitMethod.EMA_PRICE_CROSS.name:
+                            ma = EMA(self.closes, timeperiod=parameter)[-1]
                             
-                        elif condition['type'] == ExitMethod.SMA_PRICE_CROSS.name:
-                            ma = SMA(self.df.close, timeperiod=parameter)[-1]
+                        elif conditionType == ExitMethod.SMA_PRICE_CROSS.name:
+                            ma = lastSma(self.closes, parameter)
                             
                         else:
                             print('MA type not supported!')
                             
-                        close = self.df.close[-1]
                         print('ma & close: ', ma, close)
                         
                         if self.tradeDirection == TradeDirection.SHORT.name and close > ma:
@@ -85,12 +119,12 @@ class ExitEngine(object):
                         if self.tradeDirection == TradeDirection.LONG.name and close < ma:
                             self.technicalConditionSignal = MarketSentiment.BEARISH.name
 
-                    if condition['type'] == ExitMethod.DONCHIAN_CHANNEL_BREAKOUT.name:
+                    if conditionType == ExitMethod.DONCHIAN_CHANNEL_BREAKOUT.name:
                         print('checking DONCHIAN_CHANNEL_BREAKOUT exit')
                         parameter = int(condition['parameter'])
-                        close = self.df.close[-1]
-                        highestClose = self.df.close[-parameter:].max()
-                        lowestClose = self.df.close[-parameter:].min()
+                        recentCloses = self.closes[-parameter:]
+                        highestClose = recentCloses.max()
+                        lowestClose = recentCloses.min()
                         print('close, highestClose, lowestClose: ', close, highestClose, lowestClose)
                         
                         if self.tradeDirection == TradeDirection.SHORT.name and close >= highestClose:
@@ -99,18 +133,16 @@ class ExitEngine(object):
                         if self.tradeDirection == TradeDirection.LONG.name and close <= lowestClose:
                             self.technicalConditionSignal = MarketSentiment.BEARISH.name
                             
-                    if condition['type'] == ExitMethod.KELTNER_CHANNEL_BREAKOUT.name:
+                    if conditionType == ExitMethod.KELTNER_CHANNEL_BREAKOUT.name:
                         print('checking KELTNER_CHANNEL_BREAKOUT exit')
                         channelLength = int(condition['channelLength'])
                         atrParameter = int(condition['atrParameter'])
                         atrMultiplier = int(condition['atrMultiplier'])
-                        close = self.df.close.values[-1]
-                        atrSeries = ATR(self.df.high, self.df.low, self.df.close, timeperiod=atrParameter) * atrMultiplier
-                        middleBand = EMA(self.df.close, timeperiod=channelLength)
-                        upperBand = middleBand + atrSeries
-                        upperBandValue = upperBand.values[-1]
-                        lowerBand = middleBand - atrSeries
-                        lowerBandValue = lowerBand.values[-1]
+                        # only the latest band values are used, so build them from scalars
+                        atrValue = self.getAtr(atrParameter) * atrMultiplier
+                        middleBandValue = EMA(self.closes, timeperiod=channelLength)[-1]
+                        upperBandValue = middleBandValue + atrValue
+                        lowerBandValue = middleBandValue - atrValue
                         
                         print('close, lowerBandValue, upperBandValue: ', close, lowerBandValue, upperBandValue)
                         
@@ -120,11 +152,11 @@ class ExitEngine(object):
                         if self.tradeDirection == TradeDirection.SHORT.name and close >= upperBandValue:
                             self.technicalConditionSignal = MarketSentiment.BULLISH.name
                             
-                    if condition['type'] == ExitMethod.RSI_THRESHOLD.name:
+                    if conditionType == ExitMethod.RSI_THRESHOLD.name:
                         print('checking RSI_THRESHOLD exit')
                         rsiLength = int(condition['parameter'])
                         rsiThreshold = int(condition['threshold'])
-                        rsi = RSI(self.df.close, timeperiod=rsiLength).values[-1]
+                        rsi = RSI(self.closes, timeperiod=rsiLength)[-1]
                         
                         if self.tradeDirection == TradeDirection.LONG.name and rsi >= rsiThreshold:
                             self.technicalConditionSignal = MarketSentiment.BEARISH.name
@@ -137,8 +169,7 @@ class ExitEngine(object):
             print('chkpt useTrailingStop system exit entry')
             if self.tsExit['type'] == ExitMethod.ATR.name:
                 parameter = int(self.tsExit['atr_parameter'])
-                atr = ATR(self.df.high, self.df.low, self.df.close,
-                          timeperiod=parameter)[-1]
+                atr = self.getAtr(parameter)
                 atrMult = float(self.tsExit['atr_multiple'])
                 self.trailingStopDistance = round(atr * atrMult, 2)
 
@@ -171,16 +202,15 @@ class ExitEngine(object):
         if self.useTrailingStop:
             if self.tsExit['type'] == ExitMethod.ATR.name:
                 timeperiod = int(self.tsExit['atr_parameter'])
-                atr = ATR(self.df.high, self.df.low, self.df.close,
-                          timeperiod=timeperiod)[-1]
+                atr = self.getAtr(timeperiod)
                 atrMult = float(self.tsExit['atr_multiple'])
                 self.trailingStopDistance = round(atr * atrMult, 2)
                 
                 if self.tradeDirection == TradeDirection.LONG.name:
-                    self.trailingStopPrice = self.df.close.values[-1] - self.trailingStopDistance
+                    self.trailingStopPrice = self.closes[-1] - self.trailingStopDistance
                     
                 if self.tradeDirection == TradeDirection.SHORT.name:
-                    self.trailingStopPrice = self.df.close.values[-1] + self.trailingStopDistance
+                    self.trailingStopPrice = self.closes[-1] + self.trailingStopDistance
 
                 reportString = '\nuseTrailingStop ATR' \
                     + '\n\tatr_parameter:  '+str(timeperiod) \
@@ -198,16 +228,15 @@ class ExitEngine(object):
         if self.useInitialStop:
             if self.isExit['type'] == ExitMethod.ATR.name:
                 timeperiod = int(self.isExit['atr_parameter'])
-                atr = ATR(self.df.high, self.df.low, self.df.close,
-                          timeperiod=timeperiod)[-1]
+                atr = self.getAtr(timeperiod)
                 atrMult = float(self.isExit['atr_multiple'])
                 self.initialStopDistance = round(atr * atrMult, 2)
                 
                 if self.tradeDirection == TradeDirection.LONG.name:
-                    self.initialStopPrice = self.df.close.values[-1] - self.initialStopDistance
+                    self.initialStopPrice = self.closes[-1] - self.initialStopDistance
                     
                 if self.tradeDirection == TradeDirection.SHORT.name:
-                    self.initialStopPrice = self.df.close.values[-1] + self.initialStopDistance
+                    self.initialStopPrice = self.closes[-1] + self.initialStopDistance
 
                 reportString = '\nuseInitialStop ATR' \
                     + '\n\tatr_parameter:  '+str(timeperiod) \